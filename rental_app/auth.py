@@ -0,0 +1,62 @@
+# Helpers for bounding the cost of login attempts.
+
+import hashlib
+import unicodedata
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _client_ip(request):
+    # Address of the connecting client
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def _cache_key(scope, *parts):
+    # Cache key holding a failed login count. The parts are hashed so keys stay
+    # short and free of characters memcached rejects.
+    digest = hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+    return f"login-attempts:{scope}:{digest}"
+
+
+def _user_key(request, username):
+    # Failed logins for a username from one client address. The username is
+    # stripped and NFKC-normalized like AuthenticationForm does, so variants
+    # that authenticate as the same account share one counter.
+    username = unicodedata.normalize('NFKC', (username or '').strip()).lower()
+    return _cache_key('user', username, _client_ip(request))
+
+
+def _ip_key(request):
+    # Failed logins from one client address across all usernames
+    return _cache_key('ip', _client_ip(request))
+
+
+def _increment(key):
+    # Count a failed attempt; the window starts at the first failure
+    cache.add(key, 0, settings.LOGIN_ATTEMPT_TIMEOUT)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key expired between add() and incr()
+        cache.set(key, 1, settings.LOGIN_ATTEMPT_TIMEOUT)
+
+
+def is_login_throttled(request, username):
+    # True when the client has used up its failed attempts for the username or overall
+    user_key, ip_key = _user_key(request, username), _ip_key(request)
+    counts = cache.get_many([user_key, ip_key])
+    return (counts.get(user_key, 0) >= settings.LOGIN_ATTEMPT_LIMIT
+            or counts.get(ip_key, 0) >= settings.LOGIN_IP_ATTEMPT_LIMIT)
+
+
+def register_login_failure(request, username):
+    # Count a failed attempt against the username and the client address
+    _increment(_user_key(request, username))
+    _increment(_ip_key(request))
+
+
+def reset_login_failures(request, username):
+    # Forget failed attempts for the username after a successful login. The
+    # per-address count is kept so a valid account can't be used to reset it.
+    cache.delete(_user_key(request, username))
@@ -0,0 +1,95 @@
+# Benchmark for HTML page views and login throughput across session engines.
+
+import time
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from rental_app.models import UAV
+
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+# Private cache for the run, so a shared production cache and its sessions and
+# throttle counters are left alone
+BENCH_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench',
+    }
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure page views/sec and logins/sec for each session engine on a throwaway test database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--views', type=int, default=500, help='Page views per session engine')
+        parser.add_argument('--logins', type=int, default=20, help='Login attempts per session engine')
+        parser.add_argument('--engines', nargs='+', choices=SESSION_ENGINES, default=list(SESSION_ENGINES))
+        parser.add_argument('--no-throttle', action='store_true',
+                            help='Disable login throttling so every failed login is hashed')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            User.objects.create_user(username='benchuser', password='benchpassword')
+            uav = UAV.objects.create(brand='BenchBrand', model='BenchModel', weight=1.0, category='Bench')
+            pages = [reverse('home'), reverse('profile'), reverse('rent_uav', kwargs={'uav_id': uav.id})]
+            throttle_settings = {}
+            if options['no_throttle']:
+                throttle_settings = {'LOGIN_ATTEMPT_LIMIT': 10 ** 9, 'LOGIN_IP_ATTEMPT_LIMIT': 10 ** 9}
+            with override_settings(CACHES=BENCH_CACHES, **throttle_settings):
+                for name in options['engines']:
+                    with override_settings(SESSION_ENGINE=SESSION_ENGINES[name]):
+                        self.run_engine(name, pages, options['views'], options['logins'])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+    def run_engine(self, name, pages, views, logins):
+        cache.clear()
+        client = Client()
+
+        # Successful logins through the HTML form
+        start = time.perf_counter()
+        for _ in range(logins):
+            client.post(reverse('login'), {'username': 'benchuser', 'password': 'benchpassword'})
+        login_rate = logins / (time.perf_counter() - start)
+
+        # Authenticated page views, cycling through the HTML pages
+        start = time.perf_counter()
+        for i in range(views):
+            client.get(pages[i % len(pages)])
+        view_rate = views / (time.perf_counter() - start)
+
+        # Wrong passwords against one username, timing hashed and throttled attempts separately
+        # One logged-out client, so middleware setup isn't counted in the timings
+        anonymous = Client()
+        anonymous.get(reverse('login'))
+        timings = {200: [], 429: []}
+        for _ in range(logins):
+            start = time.perf_counter()
+            response = anonymous.post(reverse('login'), {'username': 'benchuser', 'password': 'wrong'})
+            timings.setdefault(response.status_code, []).append(time.perf_counter() - start)
+
+        self.stdout.write(f'{name:>15}: {view_rate:8.1f} views/s  {login_rate:8.1f} logins/s  '
+                          f'{self.rate(timings[200])} hashed failed logins/s  '
+                          f'{self.rate(timings[429])} throttled logins/s')
+
+    @staticmethod
+    def rate(timings):
+        # Attempts per second with the attempt count, or n/a when there were none
+        if not timings:
+            return f'{"n/a":>8} (0)'
+        return f'{len(timings) / sum(timings):8.1f} ({len(timings)})'
@@ -1,8 +1,10 @@
-from django.test import TestCase, RequestFactory, Client
+from django.core.cache import cache
+from django.test import TestCase, RequestFactory, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 from .models import UAV, Rental
 from .views import home_view, rent_uav, return_uav, update_rental, profile_view
+from .auth import is_login_throttled
 
 class ViewsTestCase(TestCase):
     def setUp(self):
@@ -61,3 +63,68 @@ class ViewsTestCase(TestCase):
     def test_profile_view_failure(self):
         response = self.client.get(reverse('profile'))
         self.assertRedirects(response, reverse('login') + '?next=' + reverse('profile'))
+
+
+@override_settings(LOGIN_ATTEMPT_LIMIT=3, LOGIN_IP_ATTEMPT_LIMIT=5)
+class LoginThrottleTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.request = RequestFactory().get('/')  # Same client address as self.client
+        self.user = User.objects.create_user(username='testuser', password='password')
+
+    def test_login_view_success(self):
+        response = self.client.post(reverse('login'), {'username': 'testuser', 'password': 'password'})
+        self.assertRedirects(response, reverse('home'))
+
+    def test_login_view_throttles_after_limit(self):
+        for _ in range(3):
+            response = self.client.post(reverse('login'), {'username': 'testuser', 'password': 'wrong'})
+            self.assertEqual(response.status_code, 200)
+        self.assertTrue(is_login_throttled(self.request, 'testuser'))
+        # Even the correct password is rejected while the username is throttled
+        response = self.client.post(reverse('login'), {'username': 'testuser', 'password': 'password'})
+        self.assertEqual(response.status_code, 429)
+
+    def test_login_view_throttles_username_variants(self):
+        for _ in range(3):
+            self.client.post(reverse('login'), {'username': 'testuser', 'password': 'wrong'})
+        # Variants the form normalizes to the same account share the lockout
+        for username in (' testuser', 'testuser ', '\ttestuser', '\uff54\uff45\uff53\uff54\uff55\uff53\uff45\uff52'):
+            response = self.client.post(reverse('login'), {'username': username, 'password': 'password'})
+            self.assertEqual(response.status_code, 429)
+
+    def test_login_view_throttle_is_per_address(self):
+        for _ in range(3):
+            self.client.post(reverse('login'), {'username': 'testuser', 'password': 'wrong'})
+        # The lockout only applies to the address that failed
+        response = self.client.post(reverse('login'), {'username': 'testuser', 'password': 'password'},
+                                    REMOTE_ADDR='10.0.0.2')
+        self.assertRedirects(response, reverse('home'))
+
+    def test_login_view_throttles_address_across_usernames(self):
+        for i in range(5):
+            self.client.post(reverse('login'), {'username': f'user{i}', 'password': 'wrong'})
+        response = self.client.post(reverse('login'), {'username': 'testuser', 'password': 'password'})
+        self.assertEqual(response.status_code, 429)
+
+    def test_login_view_success_resets_failures(self):
+        for _ in range(2):
+            self.client.post(reverse('login'), {'username': 'testuser', 'password': 'wrong'})
+        self.client.post(reverse('login'), {'username': 'testuser', 'password': 'password'})
+        self.client.logout()
+        self.client.post(reverse('login'), {'username': 'testuser', 'password': 'wrong'})
+        self.assertFalse(is_login_throttled(self.request, 'testuser'))
+
+    def test_api_login_throttles_after_limit(self):
+        for _ in range(3):
+            response = self.client.post(reverse('api-login'), {'username': 'testuser', 'password': 'wrong'})
+            self.assertEqual(response.status_code, 401)
+        response = self.client.post(reverse('api-login'), {'username': 'testuser', 'password': 'password'})
+        self.assertEqual(response.status_code, 429)
+
+    def test_api_login_non_string_username(self):
+        for username in (123, ['testuser']):
+            response = self.client.post(reverse('api-login'), {'username': username, 'password': 'password'},
+                                        content_type='application/json')
+            self.assertEqual(response.status_code, 401)
@@ -19,6 +19,7 @@ from rest_framework.views import APIView
 from .models import UAV, Rental
 from .serializers import UAVSerializer, RentalSerializer, UserSerializer
 from .permissions import IsAdminOrReadOnly
+from .auth import is_login_throttled, register_login_failure, reset_login_failures
 
 
 # utility functions
@@ -53,12 +54,21 @@ class ApiLoginView(generics.CreateAPIView):
         # Validate user credentials and issue a token if valid
         username = request.data.get('username')
         password = request.data.get('password')
+        # JSON bodies may carry any type, only strings can be valid usernames
+        if not isinstance(username, str):
+            return Response({'error': 'Invalid username or password'}, status=status.HTTP_401_UNAUTHORIZED)
+        # Reject throttled usernames before paying for a password hash
+        if is_login_throttled(request, username):
+            return Response({'error': 'Too many failed login attempts, try again later'},
+                            status=status.HTTP_429_TOO_MANY_REQUESTS)
         user = authenticate(username=username, password=password)
 
         if user is not None:
+            reset_login_failures(request, username)
             token, _ = Token.objects.get_or_create(user=user)
             return Response({'token': token.key}, status=status.HTTP_200_OK)
         else:
+            register_login_failure(request, username)
             return Response({'error': 'Invalid username or password'}, status=status.HTTP_401_UNAUTHORIZED)
 
 
@@ -150,17 +160,20 @@ def signup_view(request):
 def login_view(request):
     # View for user login page
     if request.method == 'POST':
+        username = request.POST.get('username')
+        # Reject throttled usernames before paying for a password hash
+        if is_login_throttled(request, username):
+            messages.error(request, 'Too many failed login attempts, try again later.')
+            form = AuthenticationForm(request, initial={'username': username})
+            return render(request, 'login.html', {'form': form}, status=429)
         form = AuthenticationForm(request, request.POST)
+        # The form authenticates while validating, reuse its user instead of hashing twice
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(request, username=username, password=password)
-            if user is not None:
-                login(request, user)
-                messages.success(request, f'Welcome to UAV Rental App, {username}!')
-                return redirect('home')
-            else:
-                messages.error(request, 'Invalid username or password.')
+            reset_login_failures(request, username)
+            login(request, form.get_user())
+            messages.success(request, f'Welcome to UAV Rental App, {username}!')
+            return redirect('home')
+        register_login_failure(request, username)
     else:
         form = AuthenticationForm()
     return render(request, 'login.html', {'form': form})
@@ -106,6 +106,45 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "uav-rental"),
+    }
+}
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.0/topics/http/sessions/#configuring-the-session-engine
+# cached_db serves session reads from the cache and only falls back to the
+# database on a miss. It needs a cache shared by all worker processes, since a
+# logout only clears the session from the current process's cache, so it is
+# only the default when CACHE_BACKEND is set. Set SESSION_ENGINE to
+# django.contrib.sessions.backends.signed_cookies to skip the database entirely.
+
+SESSION_ENGINE = os.environ.get(
+    "SESSION_ENGINE",
+    "django.contrib.sessions.backends.cached_db" if "CACHE_BACKEND" in os.environ
+    else "django.contrib.sessions.backends.db",
+)
+
+
+# Login throttling
+# Failed logins are counted in the default cache per (username, client address)
+# and per client address. Once either limit is reached, further attempts from
+# that address are rejected without hashing the password. With the local memory
+# cache the counts are per process, so set CACHE_BACKEND to a shared cache when
+# running several workers.
+
+LOGIN_ATTEMPT_LIMIT = int(os.environ.get("LOGIN_ATTEMPT_LIMIT", 5))
+
+LOGIN_IP_ATTEMPT_LIMIT = int(os.environ.get("LOGIN_IP_ATTEMPT_LIMIT", 20))
+
+LOGIN_ATTEMPT_TIMEOUT = int(os.environ.get("LOGIN_ATTEMPT_TIMEOUT", 300))
+
 LOGIN_URL = "/login/"
 
 LOGIN_REDIRECT_URL = "/profile/"